@@ -0,0 +1,297 @@
+"""
+Shared code for the example scripts
+
+Most of the examples build the same kind of part: a sketch on the XY plane
+with an outer shape and some circular holes, extruded into a plate whose
+edges are then filleted. This module builds that part so each example only
+has to describe its shape.
+
+Fusion 360 does not put a script's folder on sys.path, so every example adds
+the examples folder itself before importing this module. Example scripts
+that live in their own folder (so Fusion 360 can load them with an icon) add
+their parent folder instead. The module name is kept specific to this
+project because every script and add-in shares one interpreter and
+sys.modules.
+
+Set FUSION_MCP_BATCH=1 to skip the success message box, so that a batch of
+examples can run one after another without waiting for the user.
+"""
+
+import os
+
+import adsk.core, adsk.fusion
+
+# Bound once at import so building a part does not walk adsk.core each time
+_P = adsk.core.Point3D.create
+_COLLECTION = adsk.core.ObjectCollection.create
+_NEW_BODY = adsk.fusion.FeatureOperations.NewBodyFeatureOperation
+_CUT = adsk.fusion.FeatureOperations.CutFeatureOperation
+_NEGATIVE = adsk.fusion.ExtentDirections.NegativeExtentDirection
+
+# The message shown once a part has been created, unless the caller gives one
+DEFAULT_MESSAGE = 'Part created successfully'
+
+# ValueInputs already created, keyed by their real value. A ValueInput made by
+# createByReal is a plain value that is not tied to a design, so it can be
+# reused across runs.
+_VALUE_INPUTS = {}
+
+def value_input(value):
+    """Return a ValueInput for the real ``value``, reusing one created earlier."""
+    valueInput = _VALUE_INPUTS.get(value)
+    if valueInput is None:
+        valueInput = _VALUE_INPUTS[value] = adsk.core.ValueInput.createByReal(value)
+    return valueInput
+
+def get_empty_design(app):
+    """
+    Return an empty design to build a part in.
+
+    Adding a document is one of the slowest calls in the Fusion 360 API, so
+    the active design is reused when it is a new document that has never
+    been saved and has nothing in it yet. In every other case a new design
+    document is added, so a user's own work is never drawn into.
+    """
+    design = app.activeProduct
+    if not isinstance(design, adsk.fusion.Design) or design.parentDocument.isSaved:
+        return _add_design(app)
+
+    # Anything a user may have added to an unsaved document counts as work,
+    # so every collection is checked. The most likely ones come first and the
+    # checks stop at the first one that is not empty; only a truly empty
+    # design pays for all of them, which is still far cheaper than adding a
+    # document.
+    rootComp = design.rootComponent
+    if (rootComp.sketches.count
+            or rootComp.bRepBodies.count
+            or rootComp.occurrences.count
+            or rootComp.meshBodies.count
+            or rootComp.constructionPlanes.count
+            or rootComp.constructionAxes.count
+            or rootComp.constructionPoints.count
+            or design.userParameters.count):
+        return _add_design(app)
+    return design
+
+def _add_design(app):
+    """Add a new design document and return its design."""
+    doc = app.documents.add(adsk.core.DocumentTypes.FusionDesignDocumentType)
+    return adsk.fusion.Design.cast(doc.products.itemByProductType('DesignProductType'))
+
+def add_rectangle(lines, x0, y0, x1, y1):
+    """
+    Draw an axis-aligned rectangle from four connected sketch lines.
+
+    addTwoPointRectangle also adds horizontal, vertical and perpendicular
+    constraints that the sketch solver has to evaluate. The corners here are
+    given explicitly, so those constraints are left out.
+
+    Returns:
+        The four lines, starting with the one from (x0, y0) to (x1, y0).
+    """
+    P = _P
+    bottom = lines.addByTwoPoints(P(x0, y0, 0), P(x1, y0, 0))
+    right = lines.addByTwoPoints(bottom.endSketchPoint, P(x1, y1, 0))
+    top = lines.addByTwoPoints(right.endSketchPoint, P(x0, y1, 0))
+    left = lines.addByTwoPoints(top.endSketchPoint, bottom.startSketchPoint)
+    return [bottom, right, top, left]
+
+def object_collection(items):
+    """Return an ObjectCollection holding ``items``, created in a single call where possible."""
+    if hasattr(adsk.core.ObjectCollection, 'createWithArray'):
+        return adsk.core.ObjectCollection.createWithArray(list(items))
+
+    # Older versions of the Fusion 360 API can only add items one at a time
+    collection = _COLLECTION()
+    add = collection.add
+    for item in items:
+        add(item)
+    return collection
+
+def collect_edges(bodies):
+    """Return an ObjectCollection holding every edge of ``bodies``."""
+    edges = []
+    for body in bodies:
+        edges.extend(body.edges)
+    return object_collection(edges)
+
+def match_hole_profiles(profiles, holeCircles):
+    """
+    Match sketch profiles to the circles the holes were drawn with.
+
+    A hole's profile has a single loop made of a single circle with the same
+    center and radius as the hole's circle, so the result does not depend on
+    the order Fusion 360 returns the profiles in.
+
+    Args:
+        profiles: The profiles of the sketch.
+        holeCircles: The SketchCircles drawn for the holes.
+
+    Returns:
+        A tuple of a list of the profiles that are not holes and a list of
+        the hole profiles, in the same order as ``holeCircles``.
+
+    Raises:
+        ValueError: If a hole circle has no profile of its own.
+    """
+    holes = []
+    for circle in holeCircles:
+        center = circle.centerSketchPoint.geometry
+        holes.append((center.x, center.y, circle.radius))
+
+    plate = []
+    holeProfiles = {}
+    item = profiles.item
+    for i in range(profiles.count):
+        profile = item(i)
+        loops = profile.profileLoops
+        curves = loops.item(0).profileCurves if loops.count == 1 else None
+        circle = adsk.fusion.SketchCircle.cast(curves.item(0).sketchEntity) if curves and curves.count == 1 else None
+        if circle:
+            center = circle.centerSketchPoint.geometry
+            for index, (x, y, radius) in enumerate(holes):
+                tolerance = radius * 1e-3
+                if (index not in holeProfiles
+                        and abs(circle.radius - radius) <= tolerance
+                        and abs(center.x - x) <= tolerance
+                        and abs(center.y - y) <= tolerance):
+                    holeProfiles[index] = profile
+                    break
+            else:
+                plate.append(profile)
+        else:
+            plate.append(profile)
+
+    if len(holeProfiles) != len(holes):
+        raise ValueError(f"Found profiles for {len(holeProfiles)} of {len(holes)} holes")
+    return plate, [holeProfiles[index] for index in range(len(holes))]
+
+def make_plate_with_holes(outer_spec, holes, extrude_height, fillet_radius, hole_depth=None, message=DEFAULT_MESSAGE):
+    """
+    Create a plate with circular holes in an empty Fusion 360 design.
+
+    Args:
+        outer_spec: The outer shape of the plate, centered on the origin, as
+            ("circle", radius) or ("rect", width, height).
+        holes: A list of (x, y, radius) tuples, one for each hole.
+        extrude_height: The height of the plate.
+        fillet_radius: The radius of the fillet added to every edge, or None for no fillet.
+        hole_depth: How deep the holes are cut from the top of the plate, or None to cut them through it.
+        message: The message shown once the part has been created.
+    """
+    ui = None
+    sketch = None
+    batch = os.environ.get("FUSION_MCP_BATCH") == "1"
+    P, V = _P, value_input
+    try:
+        app = adsk.core.Application.get()
+        ui = app.userInterface
+        design = get_empty_design(app)
+
+        # Get the root component of the active design
+        rootComp = design.rootComponent
+        features = rootComp.features
+        extrudes = features.extrudeFeatures
+        fillets = features.filletFeatures
+
+        # Sketch the outer shape and the holes on the XY plane, solving once at the end.
+        # Profiles are not computed while they are hidden, so they stay hidden
+        # only while the curves are drawn.
+        sketch = rootComp.sketches.add(rootComp.xYConstructionPlane)
+        sketch.areProfilesShown = False
+        sketch.isComputeDeferred = True
+
+        circles = sketch.sketchCurves.sketchCircles
+        shape = outer_spec[0]
+        if shape == "circle":
+            circles.addByCenterRadius(P(0, 0, 0), outer_spec[1])
+        elif shape == "rect":
+            halfWidth = outer_spec[1] / 2
+            halfHeight = outer_spec[2] / 2
+            add_rectangle(sketch.sketchCurves.sketchLines, -halfWidth, -halfHeight, halfWidth, halfHeight)
+        else:
+            raise ValueError(f"Unknown outer shape: {shape}")
+
+        holeCircles = [circles.addByCenterRadius(P(x, y, 0), radius) for x, y, radius in holes]
+
+        sketch.isComputeDeferred = False
+        sketch.areProfilesShown = True
+
+        # Find the hole profiles from the circles that were drawn; the rest is the plate
+        outerProfiles, holeProfiles = match_hole_profiles(sketch.profiles, holeCircles)
+
+        # Extrude the plate. Holes that only go part of the way are extruded
+        # with it and cut back from the top afterwards.
+        if hole_depth is None:
+            plateProfiles = object_collection(outerProfiles)
+        else:
+            plateProfiles = object_collection(outerProfiles + holeProfiles)
+
+        extInput = extrudes.createInput(plateProfiles, _NEW_BODY)
+        extInput.setDistanceExtent(False, V(extrude_height))
+        ext = extrudes.add(extInput)
+
+        if hole_depth is not None and holeProfiles:
+            # Start the cut on the top of the plate, which the extrusion
+            # already holds as its end face
+            cutProfiles = object_collection(holeProfiles)
+            topFace = ext.endFaces.item(0)
+            cutInput = extrudes.createInput(cutProfiles, _CUT)
+            cutInput.startExtent = adsk.fusion.FromEntityStartDefinition.create(topFace, V(0))
+            cutDistance = adsk.fusion.DistanceExtentDefinition.create(V(hole_depth))
+            cutInput.setOneSideExtent(cutDistance, _NEGATIVE)
+            extrudes.add(cutInput)
+
+        # Fillet every edge of the plate with a single fillet feature
+        if fillet_radius is not None:
+            filletInput = fillets.createInput()
+            filletInput.addConstantRadiusEdgeSet(collect_edges(ext.bodies), V(fillet_radius), False)
+            filletInput.isG2 = False
+            filletInput.isRollingBallCorner = True
+            fillets.add(filletInput)
+
+        # The features have used up the sketch, so hide it
+        sketch.isVisible = False
+
+        if not batch:
+            ui.messageBox(message)
+
+    except Exception:
+        # traceback is only needed when something has gone wrong
+        import traceback
+        if ui:
+            ui.messageBox('Failed:\n{}'.format(traceback.format_exc()))
+
+    finally:
+        # If drawing the sketch failed, solve it and show its profiles again
+        # so the sketch is left as a user would expect. The failure may have
+        # left the sketch invalid; the error has already been reported, so a
+        # sketch that cannot be restored is left as it is.
+        try:
+            if sketch and sketch.isValid and not sketch.areProfilesShown:
+                sketch.isComputeDeferred = False
+                sketch.areProfilesShown = True
+        except Exception:
+            pass
+
+def run_shape(spec):
+    """
+    Create the part described by an example script's shape spec.
+
+    Args:
+        spec: A dictionary describing the part, with the keys:
+            outer: The outer shape, as ("circle", radius) or ("rect", width, height).
+            holes: A list of (x, y, radius) tuples, one for each hole (optional).
+            height: The height of the plate.
+            fillet: The fillet radius for every edge (optional).
+            hole_depth: How deep the holes are cut, if not through the plate (optional).
+            message: The message shown once the part has been created (optional).
+    """
+    make_plate_with_holes(
+        spec["outer"],
+        spec.get("holes", []),
+        spec["height"],
+        spec.get("fillet"),
+        hole_depth=spec.get("hole_depth"),
+        message=spec.get("message", DEFAULT_MESSAGE)
+    )